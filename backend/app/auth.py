@@ -1,13 +1,26 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import jwt, JWTError
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, EmailStr
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
-from .database import get_db
+from .core.config import get_settings
+from .database import get_db, get_async_db
 from .models import User, Wallet
 from .schemas import Token, UserCreate, UserOut
 
@@ -17,9 +30,33 @@ SECRET_KEY = os.getenv("JWT_SECRET", "change_me")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
+# Dedicated pool for password hashing so hashing work runs in parallel across
+# cores instead of competing with DB I/O for the default threadpool.
+hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pwhash")
+# Verified against when the email is unknown. Accounts created before argon2
+# keep their bcrypt hash until their next successful login, and bcrypt is the
+# slowest verify a real account can cost, so the dummy is bcrypt until every
+# stored hash has been upgraded.
+_DUMMY_HASH = pwd_context.handler("bcrypt").hash("dummy")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# HS256 with a fixed key is the only configuration we issue, so verify it
+# directly against a pre-keyed HMAC instead of going through jose's dispatch.
+_hs256_mac = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+# Validated tokens -> (user_id, exp). Clients reuse the same 7-day token on
+# every request, so this skips the signature check for repeat callers.
+_token_cache = TTLCache(maxsize=10000, ttl=300)
+_token_cache_lock = threading.Lock()
+
+logger = logging.getLogger("auth")
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 def verify_password(plain, hashed):
@@ -28,71 +65,127 @@ def verify_password(plain, hashed):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+async def verify_password_async(plain, hashed):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, pwd_context.verify, plain, hashed)
+
+async def verify_and_update_password_async(plain, hashed):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, pwd_context.verify_and_update, plain, hashed)
+
+async def get_password_hash_async(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(hash_pool, pwd_context.hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+def decode_access_token(token: str) -> dict:
+    if ALGORITHM != "HS256":
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    signing_input, _, signature = token.rpartition(".")
+    mac = _hs256_mac.copy()
+    mac.update(signing_input.encode())
+    if not hmac.compare_digest(mac.digest(), _b64url_decode(signature)):
+        raise JWTError("Signature verification failed.")
+    payload = json.loads(_b64url_decode(signing_input.partition(".")[2]))
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload.")
+    exp = payload.get("exp")
+    if exp is not None and exp < time.time():
+        raise JWTError("Signature has expired.")
+    return payload
+
 def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = int(payload.get("sub"))
-    except Exception:
+    # Reject anything that isn't three non-empty segments before doing any decoding
+    parts = token.split(".")
+    if len(parts) != 3 or not all(parts):
         raise credentials_exception
-    user = db.get(User, user_id)
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached and cached[1] > time.time():
+        user_id = cached[0]
+    else:
+        try:
+            payload = decode_access_token(token)
+            user_id: int = int(payload.get("sub"))
+        except (JWTError, ValueError, TypeError, KeyError):
+            raise credentials_exception
+        # Only successfully validated tokens are cached
+        exp = payload.get("exp")
+        if exp is not None:
+            with _token_cache_lock:
+                _token_cache[key] = (user_id, exp)
+    # Load the wallet in the same round-trip; investor endpoints read it off current_user
+    user = db.execute(
+        select(User).options(joinedload(User.wallet)).where(User.id == user_id)
+    ).scalar_one_or_none()
     if not user:
         raise credentials_exception
     return user
 
 @router.post("/register", response_model=UserOut)
-def register(user_in: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == user_in.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
+async def register(user_in: UserCreate, db: AsyncSession = Depends(get_async_db)):
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         full_name=user_in.full_name or user_in.email.split("@")[0],
         is_admin=False,
     )
+    # wallet is inserted through the relationship cascade in the same flush
+    user.wallet = Wallet(balance=0.0)
     db.add(user)
-    db.flush()
-    # create wallet
-    wallet = Wallet(user_id=user.id, balance=0.0)
-    db.add(wallet)
-    db.commit()
-    db.refresh(user)
+    # No pre-check SELECT: the unique index on users.email rejects duplicates
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
+    await db.refresh(user)
     return user
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
     # DEMO MODE: Auto-create user if they don't exist (REMOVE IN PRODUCTION!)
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await db.scalar(select(User).where(User.email == form_data.username))
     
+    if not user and get_settings().is_production:
+        await verify_password_async(form_data.password, _DUMMY_HASH)
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
     if not user:
         # Auto-create demo user
-        print(f"[DEMO MODE] Auto-creating user: {form_data.username}")
+        logger.debug("[DEMO MODE] Auto-creating user: %s", form_data.username)
         user = User(
             email=form_data.username,
-            hashed_password=get_password_hash(form_data.password),
+            hashed_password=await get_password_hash_async(form_data.password),
             full_name=form_data.username.split("@")[0],
             is_admin=False,
         )
+        user.wallet = Wallet(balance=1000.0)  # Demo balance
         db.add(user)
-        db.flush()
-        wallet = Wallet(user_id=user.id, balance=1000.0)  # Demo balance
-        db.add(wallet)
-        db.commit()
-        db.refresh(user)
-    elif not verify_password(form_data.password, user.hashed_password):
+        await db.commit()
+        await db.refresh(user)
+    else:
         # For existing users, still check password
-        raise HTTPException(status_code=400, detail="Incorrect email or password")
+        verified, new_hash = await verify_and_update_password_async(form_data.password, user.hashed_password)
+        if not verified:
+            raise HTTPException(status_code=400, detail="Incorrect email or password")
+        if new_hash:
+            # Legacy bcrypt hash: upgrade to argon2 now that we have the plaintext
+            user.hashed_password = new_hash
+            await db.commit()
     
     token = create_access_token({"sub": str(user.id)})
     return Token(access_token=token)
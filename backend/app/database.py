@@ -1,11 +1,32 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./poultry.db")
 
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, echo=False, future=True, connect_args=connect_args)
+if DATABASE_URL.startswith("sqlite"):
+    engine_args = {"connect_args": {"check_same_thread": False}}
+    async_engine_args = {}
+else:
+    # Size the pool for concurrent requests; every authenticated call hits the DB.
+    # The sync and async engines each keep their own pool, so the per-worker
+    # connection budget is split between them rather than given to both.
+    engine_args = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "15")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "30")),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    # Async routes are the cached public reads plus register/login
+    async_engine_args = {
+        "pool_size": int(os.getenv("DB_ASYNC_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10")),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+engine = create_engine(DATABASE_URL, echo=False, future=True, **engine_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 Base = declarative_base()
 
@@ -15,3 +36,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def _async_url(url: str):
+    """Map DATABASE_URL onto the matching asyncio driver (aiosqlite / asyncpg)."""
+    u = make_url(url)
+    backend = u.get_backend_name()
+    if backend == "sqlite":
+        return u.set(drivername="sqlite+aiosqlite")
+    if backend == "postgresql":
+        u = u.set(drivername="postgresql+asyncpg")
+        # asyncpg takes `ssl` rather than libpq's `sslmode`, and has no channel_binding
+        sslmode = u.query.get("sslmode")
+        u = u.difference_update_query(["sslmode", "channel_binding"])
+        if sslmode:
+            u = u.update_query_dict({"ssl": sslmode})
+        return u
+    return u
+
+# Async engine for `async def` routes so DB waits don't block the event loop
+async_engine = create_async_engine(
+    _async_url(DATABASE_URL),
+    echo=False,
+    **async_engine_args,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,13 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from fastapi.responses import ORJSONResponse
+from app.core.config import get_settings
 from app.routers import admin, investors, public
 from app import auth
-import os
 
-app = FastAPI(title=settings.PROJECT_NAME, version="1.0.0")
+settings = get_settings()
+app = FastAPI(title=settings.PROJECT_NAME, version="1.0.0", default_response_class=ORJSONResponse)
 
-origins = os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
+origins = settings.CORS_ORIGINS.split(",")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
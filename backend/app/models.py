@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Float, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum as PyEnum
@@ -24,7 +24,7 @@ class User(Base):
 class Wallet(Base):
     __tablename__ = "wallets"
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
     balance = Column(Float, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -42,12 +42,13 @@ class Farm(Base):
 
 class Batch(Base):
     __tablename__ = "batches"
+    __table_args__ = (Index("ix_batches_product_status", "product_type", "status"),)
     id = Column(Integer, primary_key=True)
-    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False)
+    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False, index=True)
     product_type = Column(Enum(ProductType), nullable=False)
     start_date = Column(DateTime, default=datetime.utcnow)
     end_date = Column(DateTime, nullable=True)
-    status = Column(String, default="PLANNED")  # PLANNED, ACTIVE, HARVESTED, CLOSED
+    status = Column(String, default="PLANNED", index=True)  # PLANNED, ACTIVE, HARVESTED, CLOSED
     unit_price = Column(Float, default=0.0)     # price per unit for investors
     target_units = Column(Integer, default=0)
     units_placed = Column(Integer, default=0)
@@ -62,8 +63,8 @@ class Batch(Base):
 class Investment(Base):
     __tablename__ = "investments"
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    batch_id = Column(Integer, ForeignKey("batches.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    batch_id = Column(Integer, ForeignKey("batches.id"), nullable=False, index=True)
     units = Column(Integer, default=0)
     amount = Column(Float, default=0.0)
     status = Column(String, default="ACTIVE")  # ACTIVE, EXITED, PAID
@@ -76,7 +77,7 @@ class Investment(Base):
 class Payout(Base):
     __tablename__ = "payouts"
     id = Column(Integer, primary_key=True)
-    investment_id = Column(Integer, ForeignKey("investments.id"), nullable=False)
+    investment_id = Column(Integer, ForeignKey("investments.id"), nullable=False, index=True)
     amount = Column(Float, default=0.0)
     kind = Column(String, default="RETURN")  # RETURN, PRINCIPAL, SALVAGE
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -86,7 +87,7 @@ class Payout(Base):
 class Transaction(Base):
     __tablename__ = "transactions"
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     amount = Column(Float, default=0.0)
     ttype = Column(String, default="DEPOSIT")  # DEPOSIT, WITHDRAW
     reference = Column(String, nullable=True)
@@ -1,23 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from typing import List
 import logging
 import os
 
 from ..database import get_db
-from ..models import User
 from ..models import Farm, Batch, ProductType, FAQ, Page, User
 from ..schemas import FarmIn, FarmOut, BatchIn, BatchOut
-from ..services.payouts import simulate_payout_for_batch, execute_payout_for_batch
-from ..core.config import settings
+from ..services.payouts import simulate_payout_for_batch, simulate_payouts_for_batches, execute_payout_for_batch
+from .public import clear_public_cache
+from ..core.config import get_settings
 
 logger = logging.getLogger("admin_router")
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_conflict_insert = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
 @router.post("/farms", response_model=FarmOut)
 def create_farm(payload: FarmIn, db: Session = Depends(get_db)):
-    # Bypass admin login: use first user in DB for development
-    user = db.query(User).order_by(User.id.asc()).first()
     try:
         farm = Farm(**payload.dict())
         db.add(farm)
@@ -31,14 +35,12 @@ def create_farm(payload: FarmIn, db: Session = Depends(get_db)):
 
 @router.get("/farms", response_model=List[FarmOut])
 def list_farms(db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
-    farms = db.query(Farm).all()
+    farms = db.scalars(select(Farm)).all()
     logger.info(f"Listed {len(farms)} farms")
     return {"success": True, "farms": farms}
 
 @router.post("/batches", response_model=BatchOut)
 def create_batch(payload: BatchIn, db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
     try:
         ptype = ProductType[payload.product_type.upper()]
         b = Batch(
@@ -65,14 +67,12 @@ def create_batch(payload: BatchIn, db: Session = Depends(get_db)):
 
 @router.get("/batches", response_model=List[BatchOut])
 def list_batches(db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
-    batches = db.query(Batch).all()
+    batches = db.scalars(select(Batch)).all()
     logger.info(f"Listed {len(batches)} batches")
     return {"success": True, "batches": batches}
 
 @router.post("/batches/{batch_id}/activate")
 def activate_batch(batch_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
     b = db.get(Batch, batch_id)
     if not b:
         logger.warning(f"Batch not found: {batch_id}")
@@ -84,7 +84,6 @@ def activate_batch(batch_id: int, db: Session = Depends(get_db)):
 
 @router.post("/batches/{batch_id}/harvest")
 def harvest_batch(batch_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
     b = db.get(Batch, batch_id)
     if not b:
         logger.warning(f"Batch not found: {batch_id}")
@@ -94,9 +93,17 @@ def harvest_batch(batch_id: int, db: Session = Depends(get_db)):
     logger.info(f"Batch harvested: {batch_id}")
     return {"success": True, "batch_id": batch_id}
 
+@router.get("/payouts/simulate")
+def simulate_all(db: Session = Depends(get_db)):
+    totals = simulate_payouts_for_batches(db)
+    logger.info(f"Simulated payouts for {len(totals)} batches")
+    return {
+        "success": True,
+        "batches": [{"batch_id": bid, "simulated_total": total} for bid, total in totals.items()],
+    }
+
 @router.get("/payouts/{batch_id}/simulate")
 def simulate(batch_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
     b = db.get(Batch, batch_id)
     if not b:
         logger.warning(f"Batch not found: {batch_id}")
@@ -107,36 +114,40 @@ def simulate(batch_id: int, db: Session = Depends(get_db)):
 
 @router.post("/payouts/{batch_id}/execute")
 def execute(batch_id: int, db: Session = Depends(get_db)):
-    user = db.query(User).order_by(User.id.asc()).first()
     b = db.get(Batch, batch_id)
     if not b:
         logger.warning(f"Batch not found: {batch_id}")
         raise HTTPException(status_code=404, detail="Batch not found")
-    payouts = execute_payout_for_batch(db, b)
+    try:
+        payouts = execute_payout_for_batch(db, b)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.error(f"Error executing payout for batch {batch_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to execute payout")
     logger.info(f"Executed payout for batch {batch_id}: {len(payouts)} payouts")
     return {"success": True, "count": len(payouts)}
 
 @router.post("/seed")
 def seed(db: Session = Depends(get_db)):
     # Disable in production for security
-    if settings.is_production:
+    if get_settings().is_production:
         logger.warning("Seed endpoint called in production - blocked")
         raise HTTPException(status_code=403, detail="Seed endpoint disabled in production")
     
-    user = db.query(User).order_by(User.id.asc()).first()
     try:
         # Make first user admin if exists
-        first_user = db.query(User).order_by(User.id.asc()).first()
+        first_user = db.scalars(select(User).order_by(User.id.asc()).limit(1)).first()
         if first_user:
             first_user.is_admin = True
         # FAQs
-        if db.query(FAQ).count() == 0:
-            faqs = [
-                FAQ(question="How do I earn?", answer="Choose a product (Egg or Chicken), fund via wallet, and receive returns per cycle."),
-                FAQ(question="Is my capital guaranteed?", answer="No. Returns depend on farm performance and market prices. We manage risks with SOPs, reserves, and audits."),
-                FAQ(question="When are payouts made?", answer="Broilers: at harvest per 7–8 week cycle. Layers: monthly during production."),
-            ]
-            db.add_all(faqs)
+        # faqs.question has no unique key to conflict on, so keep the emptiness check
+        if db.scalar(select(FAQ.id).limit(1)) is None:
+            db.execute(insert(FAQ), [
+                {"question": "How do I earn?", "answer": "Choose a product (Egg or Chicken), fund via wallet, and receive returns per cycle."},
+                {"question": "Is my capital guaranteed?", "answer": "No. Returns depend on farm performance and market prices. We manage risks with SOPs, reserves, and audits."},
+                {"question": "When are payouts made?", "answer": "Broilers: at harvest per 7–8 week cycle. Layers: monthly during production."},
+            ])
         # Pages
         from textwrap import dedent
         home = dedent("""# Turn Everyday Protein Demand Into Real Yield
@@ -153,12 +164,15 @@ We use strict farm SOPs, transparent reporting, and ring-fenced funds to protect
 4. **Invest in a live batch** and track progress on your dashboard.
 5. **Get paid** at harvest or monthly; reinvest or withdraw.
 """)
-        if db.query(Page).count() == 0:
-            db.add_all([
-                Page(slug="home", title="Welcome", body_md=home),
-                Page(slug="how-it-works", title="How It Works", body_md=how),
-            ])
+        page_insert = _conflict_insert[db.get_bind().dialect.name](Page)
+        db.execute(
+            page_insert.values([
+                {"slug": "home", "title": "Welcome", "body_md": home},
+                {"slug": "how-it-works", "title": "How It Works", "body_md": how},
+            ]).on_conflict_do_nothing(index_elements=[Page.slug])
+        )
         db.commit()
+        clear_public_cache()
         logger.info("Seeded demo content and set first user as admin")
         return {"success": True}
     except Exception as e:
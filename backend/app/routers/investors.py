@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only
 from typing import List
 import logging
 
 from ..database import get_db
-from ..models import User, Wallet, Investment, Batch
+from ..models import User, Investment, Batch
 from ..schemas import InvestmentIn, InvestmentOut, PayoutOut
 from ..auth import get_current_user
 
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/invest", tags=["investor"])
 @router.get("/wallet")
 def wallet(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     user = current_user
-    w = db.query(Wallet).filter(Wallet.user_id == user.id).first()
+    w = user.wallet
     balance = w.balance if w else 0.0
     logger.info(f"User {user.id} wallet balance: {balance}")
     return {"success": True, "balance": balance}
@@ -25,7 +26,7 @@ def deposit(amount: float, db: Session = Depends(get_db), current_user: User = D
     if amount <= 0:
         logger.warning(f"User {user.id} tried to deposit non-positive amount: {amount}")
         raise HTTPException(status_code=400, detail="Amount must be positive")
-    w = db.query(Wallet).filter(Wallet.user_id == user.id).first()
+    w = user.wallet
     if not w:
         logger.warning(f"User {user.id} wallet missing")
         raise HTTPException(status_code=400, detail="Wallet missing")
@@ -43,7 +44,7 @@ def create_investment(payload: InvestmentIn, db: Session = Depends(get_db), curr
             logger.warning(f"Batch not available for investment: {payload.batch_id}")
             raise HTTPException(status_code=400, detail="Batch not available")
         amount = batch.unit_price * payload.units
-        w = db.query(Wallet).filter(Wallet.user_id == user.id).first()
+        w = user.wallet
         if not w or w.balance < amount:
             logger.warning(f"User {user.id} has insufficient wallet balance")
             raise HTTPException(status_code=400, detail="Insufficient wallet balance")
@@ -60,9 +61,25 @@ def create_investment(payload: InvestmentIn, db: Session = Depends(get_db), curr
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create investment")
 
 @router.get("/my", response_model=List[InvestmentOut])
-def my_investments(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def my_investments(
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
     user = current_user
-    investments = db.query(Investment).filter(Investment.user_id == user.id).order_by(Investment.created_at.desc()).all()
+    stmt = (
+        select(Investment)
+        .options(load_only(
+            Investment.id, Investment.batch_id, Investment.units,
+            Investment.amount, Investment.status, Investment.created_at,
+        ))
+        .where(Investment.user_id == user.id)
+        .order_by(Investment.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    investments = db.scalars(stmt).all()
     logger.info(f"User {user.id} listed {len(investments)} investments")
     return {"success": True, "investments": investments}
 
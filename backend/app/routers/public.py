@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from ..database import get_db
+from cachetools import TTLCache
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
 from ..models import FAQ, Page, Batch, ProductType
 from ..schemas import FAQOut, PageOut, BatchOut
 from typing import List
@@ -9,12 +11,28 @@ import logging
 logger = logging.getLogger("public_router")
 router = APIRouter(prefix="/public", tags=["public"])
 
+# Landing-page content changes rarely; serve it from memory for a minute.
+# Entries can expire, or be cleared by seed from a threadpool thread, between
+# a membership test and the lookup, so read them with a single .get().
+_overview_cache = TTLCache(maxsize=1, ttl=60)
+_faq_cache = TTLCache(maxsize=1, ttl=60)
+_page_cache = TTLCache(maxsize=64, ttl=60)
+
+def clear_public_cache():
+    _overview_cache.clear()
+    _faq_cache.clear()
+    _page_cache.clear()
+
 @router.get("/overview")
-def overview(db: Session = Depends(get_db)):
-    eggs = db.query(Batch).filter(Batch.product_type == ProductType.EGG).count()
-    chicken = db.query(Batch).filter(Batch.product_type == ProductType.CHICKEN).count()
+async def overview(db: AsyncSession = Depends(get_async_db)):
+    hit = _overview_cache.get("all")
+    if hit is not None:
+        return hit
+    counts = dict((await db.execute(select(Batch.product_type, func.count()).group_by(Batch.product_type))).all())
+    eggs = counts.get(ProductType.EGG, 0)
+    chicken = counts.get(ProductType.CHICKEN, 0)
     logger.info(f"Overview stats: eggs={eggs}, chicken={chicken}")
-    return {
+    result = _overview_cache["all"] = {
         "success": True,
         "stats": {
             "batches_egg": eggs,
@@ -26,25 +44,37 @@ def overview(db: Session = Depends(get_db)):
             "Escrowed funds and clear governance (demo)",
         ],
     }
+    return result
 
 @router.get("/products", response_model=List[BatchOut])
-def products(db: Session = Depends(get_db)):
+async def products(db: AsyncSession = Depends(get_async_db)):
     # Show active/planned batches to invest in
-    batches = db.query(Batch).filter(Batch.status.in_(["PLANNED", "ACTIVE"])).order_by(Batch.created_at.desc()).all()
+    batches = (await db.scalars(
+        select(Batch).where(Batch.status.in_(["PLANNED", "ACTIVE"])).order_by(Batch.created_at.desc())
+    )).all()
     logger.info(f"Listed {len(batches)} products")
     return {"success": True, "products": batches}
 
 @router.get("/faq", response_model=List[FAQOut])
-def get_faq(db: Session = Depends(get_db)):
-    faqs = db.query(FAQ).all()
+async def get_faq(db: AsyncSession = Depends(get_async_db)):
+    hit = _faq_cache.get("all")
+    if hit is not None:
+        return hit
+    faqs = (await db.scalars(select(FAQ))).all()
     logger.info(f"Listed {len(faqs)} FAQs")
-    return {"success": True, "faqs": faqs}
+    result = _faq_cache["all"] = {"success": True, "faqs": faqs}
+    return result
 
 @router.get("/pages/{slug}", response_model=PageOut)
-def get_page(slug: str, db: Session = Depends(get_db)):
-    page = db.query(Page).filter(Page.slug == slug).first()
+async def get_page(slug: str, db: AsyncSession = Depends(get_async_db)):
+    hit = _page_cache.get(slug)
+    if hit is not None:
+        return hit
+    page = await db.scalar(select(Page).where(Page.slug == slug))
     if not page:
+        # Not cached: client-chosen slugs would otherwise evict the real pages
         logger.warning(f"Page not found: {slug}")
         return {"success": False, "page": {"slug": slug, "title": "Page", "body_md": "Content coming soon."}}
     logger.info(f"Page found: {slug}")
-    return {"success": True, "page": page}
+    result = _page_cache[slug] = {"success": True, "page": page}
+    return result
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import List
 from datetime import datetime
 from enum import Enum
 
@@ -10,30 +10,28 @@ class Token(BaseModel):
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
-    full_name: Optional[str] = None
+    full_name: str | None = None
 
 class UserOut(BaseModel):
     id: int
-    email: EmailStr
-    full_name: Optional[str] = None
+    email: str
+    full_name: str | None = None
     is_admin: bool
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class WalletOut(BaseModel):
     balance: float
 
 class FarmIn(BaseModel):
     name: str
-    location: Optional[str] = None
-    notes: Optional[str] = None
+    location: str | None = None
+    notes: str | None = None
 
 class FarmOut(FarmIn):
     id: int
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class BatchIn(BaseModel):
     farm_id: int
@@ -56,8 +54,7 @@ class BatchOut(BaseModel):
     mortality_rate: float
     expected_roi: float
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class InvestmentIn(BaseModel):
     batch_id: int
@@ -70,27 +67,23 @@ class InvestmentOut(BaseModel):
     amount: float
     status: str
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class PayoutOut(BaseModel):
     id: int
     amount: float
     kind: str
     created_at: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class FAQOut(BaseModel):
     id: int
     question: str
     answer: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 class PageOut(BaseModel):
     slug: str
     title: str
     body_md: str
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
@@ -2,32 +2,50 @@
 Batch payout utilities.
 
 - simulate_payout_for_batch: read-only calculation (no DB writes)
-- execute_payout_for_batch: create & persist Payout rows, commit, and return them
+- simulate_payouts_for_batches: the same calculation for many batches in one query
+- execute_payout_for_batch: create Payout rows in the caller's transaction and return them
 
 Assumptions:
-  * `Batch` has: .investments (relationship to Investment), .expected_roi (float like 0.15 for 15%)
+  * `Batch` has: .id, .expected_roi (float like 0.15 for 15%)
   * `Investment` has: .id, .amount
   * `Payout` has: id, investment_id, amount, kind, created_at
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import select, func, insert, literal, cast, bindparam, Numeric
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
 
 from ..models import Investment, Batch, Payout
 
 # Constants (could move to config)
 PAYOUT_KIND_RETURN = "RETURN"
+ROI_SCALE = 1_000_000  # ROI is applied as an integer number of millionths
+
+
+def _cents(amount: float) -> int:
+    """Convert a currency amount to integer cents."""
+    return int(round(amount * 100))
+
+
+def _payout_cents(amount_cents: int, roi_scaled: int) -> int:
+    """Apply a scaled ROI to an amount in cents, rounding half up, in exact integer math."""
+    return (amount_cents * roi_scaled + ROI_SCALE // 2) // ROI_SCALE
+
+
+def _apply_roi(amount: float, roi: float) -> float:
+    return _payout_cents(_cents(amount), int(round(roi * ROI_SCALE))) / 100
 
 
 def simulate_payout_for_batch(db: Session, batch: Batch) -> float:
     """
-    Compute the total payout value for a batch **without** touching the database.
+    Compute the total payout value for a batch without writing to the database.
+
+    The investment total is summed in SQL, so `batch.investments` is never loaded.
 
     Args:
-        db: SQLAlchemy Session (unused here but kept for signature consistency)
-        batch: a Batch ORM object with populated .investments and .expected_roi
+        db: SQLAlchemy Session used for the aggregate query
+        batch: a Batch ORM object with .id and .expected_roi
 
     Returns:
         float: total projected payout for all investments in the batch
@@ -37,14 +55,42 @@ def simulate_payout_for_batch(db: Session, batch: Batch) -> float:
     if batch.expected_roi is None:
         raise ValueError("Batch.expected_roi must be set")
 
-    total = 0.0
-    for inv in batch.investments or []:
-        # Guard against nulls / zero amounts
-        amt = float(inv.amount or 0.0)
-        roi = float(batch.expected_roi)
-        total += amt * roi
+    # SUM skips NULL amounts; COALESCE covers batches with no investments
+    total = db.execute(
+        select(func.coalesce(func.sum(Investment.amount), 0.0)).where(Investment.batch_id == batch.id)
+    ).scalar_one()
+
+    return _apply_roi(float(total), float(batch.expected_roi))
+
+
+def simulate_payouts_for_batches(
+    db: Session,
+    batch_ids: Optional[Iterable[int]] = None,
+) -> Dict[int, float]:
+    """
+    Compute projected payout totals for many batches with a single grouped query.
+
+    Args:
+        db: SQLAlchemy Session
+        batch_ids: batches to include; all batches when None
+
+    Returns:
+        Dict[int, float]: batch id -> total projected payout. Batches without
+        an expected_roi are omitted; batches without investments map to 0.0.
+    """
+    stmt = (
+        select(Batch.id, Batch.expected_roi, func.coalesce(func.sum(Investment.amount), 0.0))
+        .outerjoin(Investment, Investment.batch_id == Batch.id)
+        .where(Batch.expected_roi.is_not(None))
+        .group_by(Batch.id, Batch.expected_roi)
+    )
+    if batch_ids is not None:
+        stmt = stmt.where(Batch.id.in_(list(batch_ids)))
 
-    return round(total, 2)
+    return {
+        batch_id: _apply_roi(float(total), float(roi))
+        for batch_id, roi, total in db.execute(stmt)
+    }
 
 
 def execute_payout_for_batch(
@@ -53,19 +99,33 @@ def execute_payout_for_batch(
     roi_override: Optional[float] = None,
 ) -> List[Payout]:
     """
-    Persist payout rows for each investment in the batch and commit.
+    Write payout rows for each investment in the batch.
+
+    Only executes statements: the caller owns the transaction and issues the
+    single COMMIT (or rollback) around this call and its own work.
+
+    On dialects with INSERT ... RETURNING the payouts are computed and written
+    by a single INSERT ... SELECT, so no investment rows pass through Python.
+    Otherwise falls back to fetching (id, amount) for the batch's investments
+    and writing the payouts with one executemany INSERT.
+
+    Neither path reads `batch.investments`, so callers do not need to eager-load
+    it and the relationship never triggers a lazy load here.
 
     Args:
         db: SQLAlchemy Session
-        batch: Batch ORM instance with .investments loaded
+        batch: Batch ORM instance
         roi_override: optional float to override batch.expected_roi
 
     Returns:
-        List[Payout]: newly created and committed payout ORM objects
+        List[Payout]: newly created payout ORM objects, expired by the
+        caller's commit like any other session object. On the fallback path
+        these are not attached to the session and have no primary key
+        populated (bulk inserts skip fetching generated ids).
 
     Raises:
         ValueError: if batch or expected_roi is missing
-        SQLAlchemyError: bubbles up DB errors if commit fails
+        SQLAlchemyError: bubbles up DB errors; the caller rolls back
     """
     if batch is None:
         raise ValueError("Batch cannot be None")
@@ -74,31 +134,39 @@ def execute_payout_for_batch(
 
     roi = float(roi_override if roi_override is not None else batch.expected_roi)
 
-    created: List[Payout] = []
-
-    try:
-        for inv in batch.investments or []:
-            amt = float(inv.amount or 0.0)
-            if amt <= 0:
-                # skip or log invalid investment
-                continue
-
-            payout = Payout(
-                investment_id=inv.id,
-                amount=round(amt * roi, 2),
+    if db.get_bind().dialect.insert_returning:
+        stmt = (
+            insert(Payout)
+            .from_select(
+                ["investment_id", "amount", "kind"],
+                select(
+                    Investment.id,
+                    # Rounded by the database; PostgreSQL only has round(numeric, int)
+                    func.round(cast(Investment.amount * bindparam("roi", roi), Numeric), 2).label("amount"),
+                    literal(PAYOUT_KIND_RETURN),
+                ).where(Investment.batch_id == batch.id, Investment.amount > 0),
+            )
+            .returning(Payout)
+        )
+        created: List[Payout] = list(db.scalars(stmt))
+    else:
+        # No RETURNING support: a unit-of-work flush would INSERT row by row
+        # to fetch each id, so bulk-save instead (one executemany). Null /
+        # non-positive amounts are filtered in SQL (NULL > 0 is not true),
+        # same as the INSERT ... SELECT path, so the loop has no branch.
+        # Amounts are rounded in integer cents rather than with round().
+        roi_scaled = int(round(roi * ROI_SCALE))
+        created = [
+            Payout(
+                investment_id=inv_id,
+                amount=_payout_cents(_cents(amt), roi_scaled) / 100,
                 kind=PAYOUT_KIND_RETURN,
             )
-            db.add(payout)
-            created.append(payout)
-
-        db.commit()
-
-        for p in created:
-            db.refresh(p)
-
-        return created
+            for inv_id, amt in db.execute(
+                select(Investment.id, Investment.amount)
+                .where(Investment.batch_id == batch.id, Investment.amount > 0)
+            )
+        ]
+        db.bulk_save_objects(created)
 
-    except SQLAlchemyError as e:
-        db.rollback()
-        # optional: logging.error("Payout execution failed", exc_info=e)
-        raise
+    return created
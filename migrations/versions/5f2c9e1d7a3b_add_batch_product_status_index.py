@@ -0,0 +1,28 @@
+"""add batch product/status index
+
+Revision ID: 5f2c9e1d7a3b
+Revises: a24ee8a4860b
+Create Date: 2026-10-15 09:12:31.418275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c9e1d7a3b'
+down_revision: Union[str, Sequence[str], None] = 'a24ee8a4860b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_batches_product_status', 'batches', ['product_type', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_batches_product_status', table_name='batches')
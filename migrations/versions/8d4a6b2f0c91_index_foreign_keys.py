@@ -0,0 +1,39 @@
+"""index foreign keys
+
+Revision ID: 8d4a6b2f0c91
+Revises: 5f2c9e1d7a3b
+Create Date: 2026-10-15 09:40:07.562113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4a6b2f0c91'
+down_revision: Union[str, Sequence[str], None] = '5f2c9e1d7a3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # wallets.user_id is already covered by its unique constraint
+    op.create_index(op.f('ix_batches_farm_id'), 'batches', ['farm_id'], unique=False)
+    op.create_index(op.f('ix_batches_status'), 'batches', ['status'], unique=False)
+    op.create_index(op.f('ix_investments_user_id'), 'investments', ['user_id'], unique=False)
+    op.create_index(op.f('ix_investments_batch_id'), 'investments', ['batch_id'], unique=False)
+    op.create_index(op.f('ix_payouts_investment_id'), 'payouts', ['investment_id'], unique=False)
+    op.create_index(op.f('ix_transactions_user_id'), 'transactions', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transactions_user_id'), table_name='transactions')
+    op.drop_index(op.f('ix_payouts_investment_id'), table_name='payouts')
+    op.drop_index(op.f('ix_investments_batch_id'), table_name='investments')
+    op.drop_index(op.f('ix_investments_user_id'), table_name='investments')
+    op.drop_index(op.f('ix_batches_status'), table_name='batches')
+    op.drop_index(op.f('ix_batches_farm_id'), table_name='batches')